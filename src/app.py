@@ -56,8 +56,9 @@ if len(sys.argv):
                 print(f"{str(plugin_path)!r} is not an existing file!")
                 sys.exit(1)
 
-            if plugin_path.suffix.lower() in [".esp", ".esl", ".esm"]:
-                import utilities
+            import utilities
+
+            if plugin_path.suffix.lower() in utilities.PLUGIN_SUFFIXES:
                 from plugin_parser import PluginParser
                 import json
 
@@ -10,6 +10,9 @@ import subprocess
 from fnmatch import fnmatch
 from pathlib import Path
 
+# Prevents 7-Zip from opening a console window for each call (Windows only)
+CREATE_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
 
 class Archive:
     """
@@ -36,7 +39,9 @@ class Archive:
         """
 
         retcode = subprocess.run(
-            f'7z.exe x "{self.path}" -o"{dest}" -aoa -y', shell=True
+            f'7z.exe x "{self.path}" -o"{dest}" -aoa -y',
+            shell=True,
+            creationflags=CREATE_NO_WINDOW,
         )
 
         if retcode:
@@ -52,6 +57,7 @@ class Archive:
             shell=True,
             capture_output=True,
             text=True,
+            creationflags=CREATE_NO_WINDOW,
         )
 
         if process.returncode:
@@ -68,7 +74,13 @@ class Archive:
         for filename in filenames:
             cmd += f' "{filename}"'
 
-        process = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        process = subprocess.run(
+            cmd,
+            shell=True,
+            capture_output=True,
+            text=True,
+            creationflags=CREATE_NO_WINDOW,
+        )
 
         if process.returncode:
             self.log.error(process.stderr)
@@ -752,7 +752,9 @@ class TranslationsWidget(qtw.QWidget):
 
                 strings: dict[str, list[utils.String]] = {}
 
-                if file.suffix.lower() in [".7z", ".rar", ".zip"]:
+                suffix = file.suffix.lower()
+
+                if suffix in utils.ARCHIVE_SUFFIXES:
                     self.app.log.info(f"Importing translation from archive '{file}'...")
 
                     __temp = []
@@ -769,7 +771,7 @@ class TranslationsWidget(qtw.QWidget):
 
                     strings = __temp[0]
 
-                elif file.suffix.lower() in [".esp", ".esm", ".esl"]:
+                elif suffix in utils.PLUGIN_SUFFIXES:
                     self.app.log.info(f"Importing translation from '{file}'...")
 
                     plugin = installed_mods.get(file.name.lower())
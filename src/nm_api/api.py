@@ -15,6 +15,8 @@ import cloudscraper as cs
 import jstyleson as json
 import requests as req
 import websocket
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import utilities as utils
 from main import MainApp
@@ -53,6 +55,28 @@ class NexusModsApi:
 
     scraper: cs.CloudScraper = None
 
+    session = req.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            max_retries=Retry(
+                total=3,
+                connect=0,
+                read=0,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(["GET"]),
+                raise_on_status=False,
+            )
+        ),
+    )
+    """
+    Shared session for API and Web requests.
+    Reuses connections and retries requests that were answered
+    with 502, 503 or 504. Connection and read errors are not retried.
+    The last response is returned if all retries failed.
+    """
+
     log = logging.getLogger("NexusModsAPI")
 
     def __init__(self, api_key: str):
@@ -99,7 +123,7 @@ class NexusModsApi:
             }
 
             self.log.debug(f"Sending API request to {url!r}...")
-            res = req.get(url, headers=headers)
+            res = self.session.get(url, headers=headers)
             self.log.debug(f"Status Code: {res.status_code}")
 
             rem_hreq = res.headers.get("X-RL-Hourly-Remaining", "0")
@@ -164,7 +188,7 @@ class NexusModsApi:
         url = f"https://file-metadata.nexusmods.com/file/nexus-files-s3-meta/{game_id}/{mod_id}/{urllib.parse.quote(file_name)}.json"
 
         if url not in self.cache:
-            res = req.get(url)
+            res = self.session.get(url)
             self.cache[url] = res
         else:
             self.log.debug(f"Got cached Web response for {url!r}.")
@@ -5,6 +5,7 @@ Attribution-NonCommercial-NoDerivatives 4.0 International.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 import qtawesome as qta
@@ -17,6 +18,15 @@ from main import MainApp
 from widgets import ClearEntry
 
 
+@lru_cache(maxsize=64)
+def _icon(name: str, color: str) -> qtg.QIcon:
+    """
+    Returns cached qtawesome icon `name` in `color`.
+    """
+
+    return qta.icon(name, color=color)
+
+
 class AppSettings(qtw.QWidget):
     """
     Widget for application settings.
@@ -64,7 +74,8 @@ class AppSettings(qtw.QWidget):
         color_hlayout = qtw.QHBoxLayout()
         self.accent_color_entry = qtw.QLineEdit()
         self.accent_color_entry.setText(self.app.app_config["accent_color"])
-        self.accent_color_entry.textChanged.connect(self.on_change)
+        self._last_accent_color = self.accent_color_entry.text()
+        self.accent_color_entry.textChanged.connect(self.on_accent_color_change)
         color_hlayout.addWidget(self.accent_color_entry)
         self.choose_color_button = qtw.QPushButton()
 
@@ -84,16 +95,14 @@ class AppSettings(qtw.QWidget):
                     colordialog.currentColor().name(qtg.QColor.NameFormat.HexRgb)
                 )
                 self.choose_color_button.setIcon(
-                    qta.icon(
-                        "mdi6.square-rounded", color=self.accent_color_entry.text()
-                    )
+                    _icon("mdi6.square-rounded", self.accent_color_entry.text())
                 )
 
         self.choose_color_button.setText(self.mloc.choose_color)
         self.choose_color_button.setIconSize(qtc.QSize(24, 24))
         self.choose_color_button.clicked.connect(choose_color)
         self.choose_color_button.setIcon(
-            qta.icon("mdi6.square-rounded", color=self.app.app_config["accent_color"])
+            _icon("mdi6.square-rounded", self.app.app_config["accent_color"])
         )
         color_hlayout.addWidget(self.choose_color_button)
         flayout.addRow(self.mloc.accent_color, color_hlayout)
@@ -119,7 +128,7 @@ class AppSettings(qtw.QWidget):
         hlayout.addWidget(self.output_path_entry)
         browse_output_path_button = qtw.QPushButton()
         browse_output_path_button.setIcon(
-            qta.icon("fa5s.folder-open", color="#ffffff")
+            _icon("fa5s.folder-open", "#ffffff")
         )
 
         def browse():
@@ -158,6 +167,18 @@ class AppSettings(qtw.QWidget):
 
         self.on_change_signal.emit()
 
+    def on_accent_color_change(self, *args):
+        """
+        Emits change signal if accent color is a valid color
+        and differs from the last emitted one.
+        """
+
+        color = self.accent_color_entry.text()
+
+        if color != self._last_accent_color and qtg.QColor.isValidColor(color):
+            self._last_accent_color = color
+            self.on_change()
+
     def get_settings(self):
         return {
             "keep_logs_num": self.logs_num_box.value(),
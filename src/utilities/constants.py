@@ -103,3 +103,7 @@ SUPPORTED_LANGS: list[tuple[str]] = [
     ("russian", "ru_RU"),
     ("spanish", "es_ES"),
 ]
+
+# File extensions (lowercase)
+PLUGIN_SUFFIXES = frozenset({".esp", ".esm", ".esl"})
+ARCHIVE_SUFFIXES = frozenset({".7z", ".rar", ".zip"})
@@ -13,6 +13,7 @@ import jstyleson as json
 from archiver import Archive
 from plugin_parser import PluginParser
 
+from .constants import PLUGIN_SUFFIXES
 from .mod import Mod
 from .string import String
 
@@ -39,7 +40,7 @@ def import_from_archive(
     files = archive.get_files()
 
     plugin_files: list[str] = [
-        file for file in files if Path(file).suffix.lower() in [".esl", ".esm", ".esp"]
+        file for file in files if Path(file).suffix.lower() in PLUGIN_SUFFIXES
     ]
     archive.extract_files(plugin_files, tmp_dir)
 
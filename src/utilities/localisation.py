@@ -4,12 +4,13 @@ by Cutleast and falls under the license
 Attribution-NonCommercial-NoDerivatives 4.0 International.
 """
 
+import json
 import locale
 import logging
+import sys
 from pathlib import Path
 
-import jstyleson as json
-import win32api
+import jstyleson
 
 log = logging.getLogger("Utilities.Localisation")
 
@@ -28,12 +29,9 @@ class LocalisationSection:
         else:
             return "LocalisationSection"
 
-    def __getattribute__(self, __name: str) -> str:
-        try:
-            return object.__getattribute__(self, __name)
-        except AttributeError:
-            log.warning(f"Missing localisation for {__name!r} in {self!r}!")
-            return __name
+    def __getattr__(self, __name: str) -> str:
+        log.warning("Missing localisation for %r in %r!", __name, self)
+        return __name
 
 
 class Localisator:
@@ -48,6 +46,7 @@ class Localisator:
     def __init__(self, lang: str, lang_path: Path) -> None:
         self.language = lang
         self.lang_path = lang_path / lang
+        self._langs_cache: tuple[int, list[str]] | None = None
 
     def load_lang(self) -> None:
         """
@@ -58,8 +57,13 @@ class Localisator:
         # Detect system language
         if self.language == "System":
             try:
-                language_id = win32api.GetUserDefaultLangID()
-                system_language = locale.windows_locale[language_id]
+                try:
+                    import win32api
+
+                    language_id = win32api.GetUserDefaultLangID()
+                    system_language = locale.windows_locale[language_id]
+                except ImportError:
+                    system_language = locale.getlocale()[0]
                 log.debug(f"Detected system language: {system_language}")
                 self.language = system_language
                 match = list(self.lang_path.parent.glob(f"{system_language[:2]}_??"))
@@ -82,25 +86,38 @@ class Localisator:
             self.lang_path = self.lang_path.parent / self.language
 
         for lang_file in self.lang_path.glob("*.json"):
-            with open(lang_file, mode="r", encoding="utf8") as file:
-                lang_data: dict[str, str] = json.load(file)
+            data = lang_file.read_bytes()
+
+            # Fall back to jstyleson if the file is no strict JSON (e.g. comments)
+            try:
+                lang_data: dict[str, str] = json.loads(data)
+            except json.JSONDecodeError:
+                lang_data: dict[str, str] = jstyleson.loads(data.decode("utf8"))
 
             # Create root attribute
             setattr(self, lang_file.stem, LocalisationSection(lang_file.name))
             root_attr = getattr(self, lang_file.stem)
-            root_attr.__getattribute__ = self.__getattribute__
-
+            # Intern keys so that lookups via attribute names can match by identity
+            attrs = root_attr.__dict__
             for key, value in lang_data.items():
-                setattr(root_attr, key, value)
+                attrs[sys.intern(key)] = value
 
         log.info(f"Loaded localisation for {self.lang_path.name!r}.")
 
     def get_available_langs(self):
-        return [lang.name for lang in self.lang_path.parent.glob("??_??")]
-
-    def __getattribute__(self, __name: str) -> LocalisationSection:
-        try:
-            return object.__getattribute__(self, __name)
-        except AttributeError:
-            log.warning(f"Missing localisation section for {__name!r}!")
-            return LocalisationSection(__name)
+        """
+        Returns names of available localisations.
+        Result is cached until the localisation folder changes.
+        """
+
+        mtime = self.lang_path.parent.stat().st_mtime_ns
+
+        if self._langs_cache is None or self._langs_cache[0] != mtime:
+            langs = [lang.name for lang in self.lang_path.parent.glob("??_??")]
+            self._langs_cache = (mtime, langs)
+
+        return self._langs_cache[1]
+
+    def __getattr__(self, __name: str) -> LocalisationSection:
+        log.warning("Missing localisation section for %r!", __name)
+        return LocalisationSection(__name)